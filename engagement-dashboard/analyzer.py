@@ -9,26 +9,211 @@ and identifies issues that could "bury" your post immediately.
 Based on analysis of: https://github.com/twitter/the-algorithm
 """
 
-import re
+import bisect
+import functools
+import itertools
 import json
-from typing import Dict, List, Tuple
+import re
+from urllib.parse import urlsplit
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
 from dataclasses import dataclass, asdict
-from urllib.parse import urlparse
 
-
-@dataclass
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Entity patterns used by feature extraction, compiled once at import
+_URL_RE = re.compile(r'https?://[^\s]+')
+_MENTION_RE = re.compile(r'@\w+')
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# Translation tables deleting ASCII uppercase / whitespace, for C-speed counting
+_ASCII = ''.join(map(chr, range(128)))
+_ASCII_UPPER_DEL = str.maketrans('', '', ''.join(c for c in _ASCII if c.isupper()))
+_ASCII_SPACE_DEL = str.maketrans('', '', ''.join(c for c in _ASCII if c.isspace()))
+
+# Hyperscan's \s and \d follow older Unicode tables than re; these classes
+# cover everything re matches (all non-ASCII code points count as digits)
+_HS_SPACE = r'[\s\x1c-\x1f]'
+_HS_DIGIT = r'[0-9\x{80}-\x{D7FF}\x{E000}-\x{10FFFF}]'
+
+# The only characters re.IGNORECASE matches to an a-z letter that lower()
+# does not turn into that letter
+_IGNORECASE_LETTERS = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+# Punctuation commonly trailing a mention/hashtag ("@bob," or "#ai!")
+_TRAILING_PUNCT = '.,!?;:'
+
+
+def _is_word(s: str) -> bool:
+    """True if s is a non-empty run of word characters (like \\w+)"""
+    return s.replace('_', 'a').isalnum()
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text so lowercase a-z patterns match it as under re.IGNORECASE"""
+    if not text.isascii():
+        text = text.translate(_IGNORECASE_LETTERS)
+    return text.lower()
+
+
+def _batch_args(texts: List[str], has_media: Optional[List[bool]],
+                media_types: Optional[List[str]],
+                is_reply: Optional[List[bool]]) -> Iterator[Tuple]:
+    """Per-tweet (text, has_media, media_type, is_reply), filling in defaults"""
+    n = len(texts)
+    return zip(texts, has_media or [False] * n, media_types or [None] * n,
+               is_reply or [False] * n)
+
+
+def _first_matches(regexes: Tuple, text: str, limit: int) -> List[str]:
+    """Up to `limit` matched strings across regexes, stopping once the limit is hit"""
+    matches: List[str] = []
+    for regex in regexes:
+        matches.extend(m.group(0) for m in itertools.islice(regex.finditer(text), limit - len(matches)))
+        if len(matches) >= limit:
+            break
+    return matches
+
+
+def _count_label(matches: List[str], cap: int) -> str:
+    """Match count for display, e.g. "4+" when scanning stopped past the cap"""
+    return f'{cap}+' if len(matches) > cap else str(len(matches))
+
+
+def _url_netloc(url: str) -> str:
+    """Network location of an http(s) URL (what urlparse calls netloc)"""
+    netloc = url.split('://', 1)[1]
+    for sep in '/?#':
+        netloc = netloc.split(sep, 1)[0]
+    return netloc
+
+
+def _netloc_is_malformed(netloc: str) -> bool:
+    """True if urlparse would reject this netloc (bad brackets, NFKC spoofs like "a℀b.com")"""
+    if netloc.isascii() and '[' not in netloc and ']' not in netloc:
+        return False
+    try:
+        urlsplit('//' + netloc)
+    except ValueError:
+        return True
+    return False
+
+
+def _extract_entities(text: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Extract URLs, mentions and hashtags in one pass over whitespace tokens
+    Returns: (urls, mentions, hashtags)
+
+    Plain tokens such as "https://x.com/a", "@bob," or "#ai" are classified
+    directly; anything else containing a trigger character falls back to the
+    regexes so results match a full-text findall exactly.
+    """
+    # Most tweets have no entities at all; skip tokenizing them
+    if '://' not in text and '@' not in text and '#' not in text:
+        return [], [], []
+
+    urls: List[str] = []
+    mentions: List[str] = []
+    hashtags: List[str] = []
+    for token in text.split():
+        first = token[0]
+        if first == '@' or first == '#':
+            tag = token[1:].rstrip(_TRAILING_PUNCT)
+            if _is_word(tag):
+                (mentions if first == '@' else hashtags).append(first + tag)
+                continue
+        elif (token.startswith(('http://', 'https://')) and not token.endswith('://')
+              and '@' not in token and '#' not in token):
+            urls.append(token)
+            continue
+
+        if '://' in token:
+            urls.extend(_URL_RE.findall(token))
+        if '@' in token:
+            mentions.extend(_MENTION_RE.findall(token))
+        if '#' in token:
+            hashtags.extend(_HASHTAG_RE.findall(token))
+
+    return urls, mentions, hashtags
+
+
+@dataclass(slots=True, frozen=True)
+class Features:
+    """Analyzable features extracted from a tweet (immutable, slotted)"""
+    text_length: int
+    char_count: int
+    caps_ratio: float
+    upper_count: int
+    whitespace_count: int
+    newline_count: int
+    has_question: bool
+    question_count: int
+    urls: Tuple[str, ...]
+    url_count: int
+    suspicious_urls: Tuple[str, ...]
+    mentions: Tuple[str, ...]
+    mention_count: int
+    hashtags: Tuple[str, ...]
+    hashtag_count: int
+    has_media: bool
+    media_type: str
+    is_reply: bool
+    is_from_followed_account: bool = False  # Unknown pre-posting; assume OON
+
+
+class Penalty(NamedTuple):
+    """A single penalty applied to a tweet's score"""
+    type: str
+    severity: str  # "LOW", "MEDIUM", "HIGH", "CRITICAL"
+    impact: str
+    description: str
+    details: Optional[str]  # None when analyzed with emit_details=False
+
+
+class Boost(NamedTuple):
+    """A single engagement boost applied to a tweet's score"""
+    type: str
+    impact: str
+    description: str
+    details: str
+
+
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
-    """Complete analysis result for a tweet"""
+    """Complete analysis result for a tweet (deeply immutable, slotted)"""
     overall_score: float  # 0-100
     risk_level: str  # "LOW", "MEDIUM", "HIGH", "CRITICAL"
     safety_score: float
     quality_score: float
     engagement_potential: float
-    penalties: List[Dict[str, any]]
-    boosts: List[Dict[str, any]]
-    warnings: List[str]
-    recommendations: List[str]
-    feature_breakdown: Dict[str, any]
+    penalties: Tuple[Penalty, ...]
+    boosts: Tuple[Boost, ...]
+    warnings: Tuple[str, ...]
+    recommendations: Tuple[str, ...]
+    feature_breakdown: Features
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for JSON export (penalties/boosts as objects, not arrays)"""
+        data = asdict(self)
+        data['penalties'] = [p._asdict() for p in self.penalties]
+        data['boosts'] = [b._asdict() for b in self.boosts]
+        return data
 
 
 class EngagementAnalyzer:
@@ -36,25 +221,25 @@ class EngagementAnalyzer:
 
     # Toxicity patterns (simplified - real model uses ML)
     TOXIC_PATTERNS = [
-        r'\b(hate|stupid|idiot|dumb|trash|garbage|worst)\b',
-        r'\b(kill|die|death|hurt)\s+(you|yourself|them)',
-        r'\b(f\*ck|sh\*t|damn|hell)\s+(you|off)',
-        r'\b(loser|pathetic|disgusting|horrible)\b',
+        r'\b(?:hate|stupid|idiot|dumb|trash|garbage|worst)\b',
+        r'\b(?:kill|die|death|hurt)\s+(?:you|yourself|them)',
+        r'\b(?:f\*ck|sh\*t|damn|hell)\s+(?:you|off)',
+        r'\b(?:loser|pathetic|disgusting|horrible)\b',
     ]
 
     # Spam indicators
     SPAM_PATTERNS = [
-        r'(?i)(click here|follow for follow|f4f|l4l)',
-        r'(?i)(buy now|limited time|act now|offer expires)',
-        r'(?i)(make \$\d+|earn money fast|work from home)',
-        r'(?i)(crypto|bitcoin|nft).*(guaranteed|profit|returns)',
-        r'(?i)(dm for|check bio|link in bio).*(\$|money|cash|paid)',
+        r'(?:click here|follow for follow|f4f|l4l)',
+        r'(?:buy now|limited time|act now|offer expires)',
+        r'(?:make \$\d+|earn money fast|work from home)',
+        r'(?:crypto|bitcoin|nft).*(?:guaranteed|profit|returns)',
+        r'(?:dm for|check bio|link in bio).*(?:\$|money|cash|paid)',
     ]
 
     # NSFW text patterns
     NSFW_PATTERNS = [
-        r'(?i)\b(sex|porn|xxx|nsfw|nude|naked)\b',
-        r'(?i)\b(sexual|explicit|adult content)\b',
+        r'\b(?:sex|porn|xxx|nsfw|nude|naked)\b',
+        r'\b(?:sexual|explicit|adult content)\b',
     ]
 
     # Untrusted URL patterns (common spam/malicious domains)
@@ -72,13 +257,102 @@ class EngagementAnalyzer:
     MAX_CAPS_RATIO = 0.3  # More than 30% caps is bad
     RECOMMENDED_CAPS_RATIO = 0.1  # 10% is okay
 
+    # Quality penalty tables. Each rule is (type, severity, penalty,
+    # description, details, warning); description/warning are format
+    # templates over `length` and `caps_ratio`.
+    # bisect_right: bucket i holds lengths below LENGTH_BUCKETS[i]
+    LENGTH_BUCKETS = (10, OPTIMAL_LENGTH_MIN)
+    LENGTH_PENALTIES = (
+        ('TOO_SHORT', 'MEDIUM', 30, 'Tweet too short ({length} chars)',
+         'Very short tweets get less engagement',
+         '⚠️  Tweet too short ({length} chars) - low engagement expected'),
+        ('BELOW_OPTIMAL', 'LOW', 10, 'Below optimal length ({length} chars)',
+         f'Aim for {OPTIMAL_LENGTH_MIN}-{OPTIMAL_LENGTH_MAX} chars',
+         None),
+        None,
+    )
+    # bisect_left: bucket i holds ratios above CAPS_BUCKETS[i - 1]
+    CAPS_BUCKETS = (MAX_CAPS_RATIO, 0.5)
+    CAPS_PENALTIES = (
+        None,
+        ('HIGH_CAPS', 'MEDIUM', 15, 'High capitalization ({caps_ratio:.1%})',
+         'Reduces perceived quality',
+         '⚠️  High caps ratio ({caps_ratio:.0%}) - reduce for better quality'),
+        ('EXCESSIVE_CAPS', 'HIGH', 40, 'Excessive capitalization ({caps_ratio:.1%})',
+         'May be flagged as spam or low quality',
+         '⚠️  HIGH: Excessive caps ({caps_ratio:.0%}) - looks like spam'),
+    )
+
+    # Match counts at which the toxic/spam penalties hit their caps
+    TOXIC_MATCH_CAP = 4  # 4 * 15 >= 60
+    SPAM_MATCH_CAP = 4  # 4 * 20 >= 70
+
     def __init__(self):
-        self.toxic_regex = [re.compile(p, re.IGNORECASE) for p in self.TOXIC_PATTERNS]
-        self.spam_regex = [re.compile(p, re.IGNORECASE) for p in self.SPAM_PATTERNS]
-        self.nsfw_regex = [re.compile(p, re.IGNORECASE) for p in self.NSFW_PATTERNS]
+        # As few scans per category as keep per-pattern match counts intact.
+        # Patterns only use non-capturing groups, so matches are flat strings.
+        self.toxic_regex = self._compile_union(self.TOXIC_PATTERNS)
+        self.spam_regex = self._compile_union(self.SPAM_PATTERNS)
+        self.nsfw_regex = self._compile_union(self.NSFW_PATTERNS)
+        # All suspicious domain fragments recognised in one search per URL
+        self.suspicious_domain_regex = re.compile(
+            '|'.join(re.escape(d) for d in self.SUSPICIOUS_DOMAINS)
+        )
+        # Optional Hyperscan prefilter: one pass tells which categories can match
+        self.safety_db = self._compile_safety_db() if hyperscan is not None else None
+        # Re-analyzing an unchanged draft reuses the previous result; typed so
+        # has_media=1 and has_media=True keep separate (differently printed) results
+        self._analyze_cached = functools.lru_cache(maxsize=1024, typed=True)(self._analyze)
+
+    @staticmethod
+    def _compile_union(patterns: List[str]) -> Tuple:
+        """
+        Compile lowercase patterns into a tuple of regexes to scan in turn
+        (phrases share one alternation; each ".*" pattern scans on its own)
+        """
+        phrases = [p for p in patterns if '.*' not in p]
+        spanning = [p for p in patterns if '.*' in p]
+        regexes = [re.compile('|'.join(f'(?:{p})' for p in phrases))] if phrases else []
+        regexes.extend(re.compile(p) for p in spanning)
+        return tuple(regexes)
+
+    def _compile_safety_db(self):
+        """Hyperscan prefilter database of every safety pattern, tagged 0/1/2 by category"""
+        categories = (self.TOXIC_PATTERNS, self.SPAM_PATTERNS, self.NSFW_PATTERNS)
+        expressions = []
+        ids = []
+        for category_id, patterns in enumerate(categories):
+            expressions.extend(p.replace(r'\s', _HS_SPACE).replace(r'\d', _HS_DIGIT).encode('utf-8')
+                               for p in patterns)
+            ids.extend([category_id] * len(patterns))
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=(hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                   | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER),
+        )
+        return db
+
+    def _safety_categories(self, text_lower: str) -> Tuple[bool, bool, bool]:
+        """Which of (toxic, spam, nsfw) may match, from a single Hyperscan pass"""
+        if self.safety_db is None:
+            return True, True, True
+        try:
+            data = text_lower.encode('utf-8')
+        except UnicodeEncodeError:
+            return True, True, True  # Lone surrogates: leave it to the regexes
+        hits = [False, False, False]
+
+        def on_match(category_id, start, end, flags, context):
+            hits[category_id] = True
+
+        self.safety_db.scan(data, match_event_handler=on_match)
+        return hits[0], hits[1], hits[2]
 
     def analyze(self, text: str, has_media: bool = False,
-                media_type: str = None, is_reply: bool = False) -> AnalysisResult:
+                media_type: str = None, is_reply: bool = False,
+                emit_details: bool = True) -> AnalysisResult:
         """
         Analyze tweet for engagement potential
 
@@ -87,15 +361,23 @@ class EngagementAnalyzer:
             has_media: Whether tweet has media attachments
             media_type: Type of media (image, video, gif)
             is_reply: Whether this is a reply
+            emit_details: Build each penalty's details string (set False
+                for score-only callers to skip the formatting work)
         """
+        # Results are deeply immutable, so the cached instance is shared as is
+        return self._analyze_cached(text, has_media, media_type, is_reply, emit_details)
+
+    def _analyze(self, text: str, has_media: bool, media_type: str,
+                 is_reply: bool, emit_details: bool) -> AnalysisResult:
+        """Uncached analysis pipeline behind analyze()"""
         # Extract features
         features = self._extract_features(text, has_media, media_type, is_reply)
 
         # Safety analysis (MOST CRITICAL - can cause immediate burial)
-        safety_score, safety_warnings, safety_penalties = self._analyze_safety(text, features)
+        safety_score, safety_warnings, safety_penalties = self._analyze_safety(text, features, emit_details)
 
         # Quality analysis
-        quality_score, quality_warnings, quality_penalties = self._analyze_quality(features)
+        quality_score, quality_warnings, quality_penalties = self._analyze_quality(features, emit_details)
 
         # Engagement potential
         engagement_score, engagement_boosts = self._analyze_engagement_potential(features)
@@ -122,79 +404,158 @@ class EngagementAnalyzer:
             safety_score=round(safety_score, 1),
             quality_score=round(quality_score, 1),
             engagement_potential=round(engagement_score, 1),
-            penalties=all_penalties,
-            boosts=engagement_boosts,
-            warnings=all_warnings,
-            recommendations=recommendations,
+            penalties=tuple(all_penalties),
+            boosts=tuple(engagement_boosts),
+            warnings=tuple(all_warnings),
+            recommendations=tuple(recommendations),
             feature_breakdown=features
         )
 
+    def analyze_batch(self, texts: List[str], has_media: List[bool] = None,
+                      media_types: List[str] = None, is_reply: List[bool] = None,
+                      emit_details: bool = True) -> List[AnalysisResult]:
+        """
+        Analyze many tweets in one call
+
+        Takes the same per-tweet lists as score_batch() and returns one
+        AnalysisResult per text, equal to analyze() on that text. Compiled
+        patterns and the analysis cache are shared across the whole batch.
+        """
+        analyze = self.analyze
+        return [analyze(text, media, media_type, reply, emit_details)
+                for text, media, media_type, reply
+                in _batch_args(texts, has_media, media_types, is_reply)]
+
+    def score(self, text: str, has_media: bool = False,
+              media_type: str = None, is_reply: bool = False) -> float:
+        """
+        Compute only the overall score (same value as analyze().overall_score)
+
+        Skips building penalties, boosts, warnings and recommendations, and
+        runs the numeric scoring through the compiled _score_kernel.
+        """
+        _, _, _, overall_score = _score_kernel(
+            *self._score_inputs(text, has_media, media_type, is_reply)
+        )
+        return round(overall_score, 1)
+
+    def score_batch(self, texts: List[str], has_media: List[bool] = None,
+                    media_types: List[str] = None,
+                    is_reply: List[bool] = None) -> List[float]:
+        """
+        Compute overall scores for many tweets at once
+
+        Args:
+            texts: Tweet texts
+            has_media: Per-tweet media flags (default: all False)
+            media_types: Per-tweet media types (default: all None)
+            is_reply: Per-tweet reply flags (default: all False)
+
+        Returns one score per text, equal to score() on that text. With numba
+        installed the scoring runs as a single compiled loop over arrays.
+        """
+        if not texts:
+            return []
+        rows = [self._score_inputs(*args)
+                for args in _batch_args(texts, has_media, media_types, is_reply)]
+        if HAS_NUMBA:
+            columns = [np.asarray(column) for column in zip(*rows)]
+            scores = _score_batch_kernel(*columns)
+        else:
+            scores = [_score_kernel(*row)[3] for row in rows]
+        return [round(float(s), 1) for s in scores]
+
+    def _score_inputs(self, text: str, has_media: bool, media_type: str,
+                      is_reply: bool) -> Tuple:
+        """Scalar arguments for _score_kernel, in signature order"""
+        features = self._extract_features(text, has_media, media_type, is_reply)
+        text_lower = _fold_case(text)
+        has_toxic, has_spam, has_nsfw = self._safety_categories(text_lower)
+        return (
+            len(_first_matches(self.toxic_regex, text_lower, self.TOXIC_MATCH_CAP)) if has_toxic else 0,
+            len(_first_matches(self.spam_regex, text_lower, self.SPAM_MATCH_CAP)) if has_spam else 0,
+            has_nsfw and bool(_first_matches(self.nsfw_regex, text_lower, 1)),
+            bool(features.suspicious_urls),
+            features.text_length,
+            float(features.caps_ratio),
+            features.newline_count,
+            features.hashtag_count,
+            features.has_question,
+            has_media,
+            _MEDIA_TYPE_CODES.get(media_type, 0),
+        )
+
     def _extract_features(self, text: str, has_media: bool,
-                         media_type: str, is_reply: bool) -> Dict:
+                         media_type: str, is_reply: bool) -> Features:
         """Extract all analyzable features from tweet"""
         # Basic text features
         text_length = len(text)
-        char_count = len([c for c in text if not c.isspace()])
+
+        # Character classification
+        if text.isascii():
+            # str.translate/count run in C; exact for ASCII-only text
+            whitespace_count = text_length - len(text.translate(_ASCII_SPACE_DEL))
+            upper_count = text_length - len(text.translate(_ASCII_UPPER_DEL))
+            newline_count = text.count('\n')
+            char_count = text_length - whitespace_count
+        else:
+            # Single pass with the full Unicode isspace()/isupper() rules
+            char_count = upper_count = whitespace_count = newline_count = 0
+            for c in text:
+                if c.isspace():
+                    whitespace_count += 1
+                    if c == '\n':
+                        newline_count += 1
+                else:
+                    char_count += 1
+                    if c.isupper():
+                        upper_count += 1
 
         # Capitalization analysis
-        upper_count = sum(1 for c in text if c.isupper())
         caps_ratio = upper_count / char_count if char_count > 0 else 0
 
-        # Whitespace analysis
-        whitespace_count = sum(1 for c in text if c.isspace())
-        newline_count = text.count('\n')
-
         # Question detection (engagement boost)
         question_marks = text.count('?')
         has_question = '?' in text
 
-        # URL extraction
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, text)
+        # URL, mention and hashtag extraction
+        urls, mentions, hashtags = _extract_entities(text)
         url_count = len(urls)
-
-        # Mention detection
-        mention_pattern = r'@\w+'
-        mentions = re.findall(mention_pattern, text)
         mention_count = len(mentions)
-
-        # Hashtag detection
-        hashtag_pattern = r'#\w+'
-        hashtags = re.findall(hashtag_pattern, text)
         hashtag_count = len(hashtags)
 
         # Check for suspicious URLs
         suspicious_urls = []
         for url in urls:
-            try:
-                domain = urlparse(url).netloc.lower()
-                if any(suspicious in domain for suspicious in self.SUSPICIOUS_DOMAINS):
-                    suspicious_urls.append(url)
-            except:
+            netloc = _url_netloc(url)
+            if _netloc_is_malformed(netloc):
                 suspicious_urls.append(url)  # Malformed URLs are suspicious
+            elif self.suspicious_domain_regex.search(netloc.lower()):
+                suspicious_urls.append(url)
+
+        return Features(
+            text_length=text_length,
+            char_count=char_count,
+            caps_ratio=caps_ratio,
+            upper_count=upper_count,
+            whitespace_count=whitespace_count,
+            newline_count=newline_count,
+            has_question=has_question,
+            question_count=question_marks,
+            urls=tuple(urls),
+            url_count=url_count,
+            suspicious_urls=tuple(suspicious_urls),
+            mentions=tuple(mentions),
+            mention_count=mention_count,
+            hashtags=tuple(hashtags),
+            hashtag_count=hashtag_count,
+            has_media=has_media,
+            media_type=media_type,
+            is_reply=is_reply,
+        )
 
-        return {
-            'text_length': text_length,
-            'char_count': char_count,
-            'caps_ratio': caps_ratio,
-            'upper_count': upper_count,
-            'whitespace_count': whitespace_count,
-            'newline_count': newline_count,
-            'has_question': has_question,
-            'question_count': question_marks,
-            'urls': urls,
-            'url_count': url_count,
-            'suspicious_urls': suspicious_urls,
-            'mentions': mentions,
-            'mention_count': mention_count,
-            'hashtags': hashtags,
-            'hashtag_count': hashtag_count,
-            'has_media': has_media,
-            'media_type': media_type,
-            'is_reply': is_reply,
-        }
-
-    def _analyze_safety(self, text: str, features: Dict) -> Tuple[float, List[str], List[Dict]]:
+    def _analyze_safety(self, text: str, features: Features,
+                        emit_details: bool = True) -> Tuple[float, List[str], List[Penalty]]:
         """
         Analyze safety signals - CRITICAL for avoiding burial
         Returns: (score, warnings, penalties)
@@ -203,79 +564,76 @@ class EngagementAnalyzer:
         warnings = []
         penalties = []
 
-        # Check toxicity patterns
-        toxic_matches = []
-        for pattern in self.toxic_regex:
-            matches = pattern.findall(text)
-            if matches:
-                toxic_matches.extend(matches)
+        # Safety patterns are lowercase; lowercase the text once for all scans
+        text_lower = _fold_case(text)
+        # Regex scans (which also collect match text) only run for categories
+        # the prefilter could not rule out
+        has_toxic, has_spam, has_nsfw = self._safety_categories(text_lower)
+
+        # Check toxicity patterns (one match past the cap shows there are more)
+        toxic_matches = (_first_matches(self.toxic_regex, text_lower, self.TOXIC_MATCH_CAP + 1)
+                         if has_toxic else [])
 
         if toxic_matches:
             penalty_severity = min(len(toxic_matches) * 15, 60)
             score -= penalty_severity
-            penalties.append({
-                'type': 'HIGH_TOXICITY',
-                'severity': 'CRITICAL' if penalty_severity > 40 else 'HIGH',
-                'impact': f'-{penalty_severity}%',
-                'description': f'Toxic language detected: {len(toxic_matches)} pattern(s)',
-                'details': f'Matched: {", ".join(set(toxic_matches[:3]))}...'
-            })
+            penalties.append(Penalty(
+                type='HIGH_TOXICITY',
+                severity='CRITICAL' if penalty_severity > 40 else 'HIGH',
+                impact=f'-{penalty_severity}%',
+                description=f'Toxic language detected: {_count_label(toxic_matches, self.TOXIC_MATCH_CAP)} pattern(s)',
+                details=f'Matched: {", ".join(set(toxic_matches[:3]))}...' if emit_details else None
+            ))
             warnings.append(f'🚨 CRITICAL: Toxic language detected - may be filtered or downranked to "Abusive Quality" section')
 
         # Check spam patterns
-        spam_matches = []
-        for pattern in self.spam_regex:
-            matches = pattern.findall(text)
-            if matches:
-                spam_matches.extend(matches)
+        spam_matches = (_first_matches(self.spam_regex, text_lower, self.SPAM_MATCH_CAP + 1)
+                        if has_spam else [])
 
         if spam_matches:
             penalty_severity = min(len(spam_matches) * 20, 70)
             score -= penalty_severity
-            penalties.append({
-                'type': 'HIGH_SPAMMY_CONTENT',
-                'severity': 'CRITICAL' if penalty_severity > 50 else 'HIGH',
-                'impact': f'-{penalty_severity}%',
-                'description': f'Spam patterns detected: {len(spam_matches)} indicator(s)',
-                'details': f'Matched: {", ".join(set([m[0] if isinstance(m, tuple) else m for m in spam_matches[:3]]))}...'
-            })
+            penalties.append(Penalty(
+                type='HIGH_SPAMMY_CONTENT',
+                severity='CRITICAL' if penalty_severity > 50 else 'HIGH',
+                impact=f'-{penalty_severity}%',
+                description=f'Spam patterns detected: {_count_label(spam_matches, self.SPAM_MATCH_CAP)} indicator(s)',
+                details=f'Matched: {", ".join(set(spam_matches[:3]))}...' if emit_details else None
+            ))
             warnings.append(f'🚨 CRITICAL: Spam indicators detected - may trigger GrokSpamFilter (hard filter)')
 
-        # Check NSFW patterns
-        nsfw_matches = []
-        for pattern in self.nsfw_regex:
-            matches = pattern.findall(text)
-            if matches:
-                nsfw_matches.extend(matches)
+        # Check NSFW patterns (fixed penalty; three matches are enough for details)
+        nsfw_matches = _first_matches(self.nsfw_regex, text_lower, 3) if has_nsfw else []
 
         if nsfw_matches:
             penalty_severity = 50
             score -= penalty_severity
-            penalties.append({
-                'type': 'NSFW_CONTENT',
-                'severity': 'CRITICAL',
-                'impact': f'-{penalty_severity}%',
-                'description': 'NSFW content detected',
-                'details': f'Matched: {", ".join(set(nsfw_matches[:3]))}...'
-            })
+            penalties.append(Penalty(
+                type='NSFW_CONTENT',
+                severity='CRITICAL',
+                impact=f'-{penalty_severity}%',
+                description='NSFW content detected',
+                details=f'Matched: {", ".join(set(nsfw_matches[:3]))}...' if emit_details else None
+            ))
             warnings.append(f'🚨 CRITICAL: NSFW content detected - may trigger GrokNsfwFilter (hard filter)')
 
         # Check suspicious URLs
-        if features['suspicious_urls']:
+        if features.suspicious_urls:
             penalty_severity = 40
             score -= penalty_severity
-            penalties.append({
-                'type': 'UNTRUSTED_URL',
-                'severity': 'HIGH',
-                'impact': f'-{penalty_severity}%',
-                'description': f'Suspicious URLs detected: {len(features["suspicious_urls"])}',
-                'details': f'URLs: {", ".join(features["suspicious_urls"][:2])}'
-            })
+            penalties.append(Penalty(
+                type='UNTRUSTED_URL',
+                severity='HIGH',
+                impact=f'-{penalty_severity}%',
+                description=f'Suspicious URLs detected: {len(features.suspicious_urls)}',
+                details=f'URLs: {", ".join(features.suspicious_urls[:2])}' if emit_details else None
+            ))
             warnings.append(f'⚠️  HIGH: Suspicious URLs may trigger "Abusive Quality" downranking')
 
         return max(score, 0), warnings, penalties
 
-    def _analyze_quality(self, features: Dict) -> Tuple[float, List[str], List[Dict]]:
+    def _analyze_quality(self, features: Features,
+                         emit_details: bool = True) -> Tuple[float, List[str], List[Penalty]]:
         """
         Analyze text quality features
         Returns: (score, warnings, penalties)
@@ -284,168 +642,147 @@ class EngagementAnalyzer:
         warnings = []
         penalties = []
 
-        # Length analysis
-        length = features['text_length']
-        if length < 10:
-            penalty = 30
-            score -= penalty
-            penalties.append({
-                'type': 'TOO_SHORT',
-                'severity': 'MEDIUM',
-                'impact': f'-{penalty}%',
-                'description': f'Tweet too short ({length} chars)',
-                'details': 'Very short tweets get less engagement'
-            })
-            warnings.append(f'⚠️  Tweet too short ({length} chars) - low engagement expected')
-        elif length < self.OPTIMAL_LENGTH_MIN:
-            penalty = 10
-            score -= penalty
-            penalties.append({
-                'type': 'BELOW_OPTIMAL',
-                'severity': 'LOW',
-                'impact': f'-{penalty}%',
-                'description': f'Below optimal length ({length} chars)',
-                'details': f'Aim for {self.OPTIMAL_LENGTH_MIN}-{self.OPTIMAL_LENGTH_MAX} chars'
-            })
-
-        # Caps analysis
-        caps_ratio = features['caps_ratio']
-        if caps_ratio > 0.5:
-            penalty = 40
-            score -= penalty
-            penalties.append({
-                'type': 'EXCESSIVE_CAPS',
-                'severity': 'HIGH',
-                'impact': f'-{penalty}%',
-                'description': f'Excessive capitalization ({caps_ratio:.1%})',
-                'details': 'May be flagged as spam or low quality'
-            })
-            warnings.append(f'⚠️  HIGH: Excessive caps ({caps_ratio:.0%}) - looks like spam')
-        elif caps_ratio > self.MAX_CAPS_RATIO:
-            penalty = 15
+        # Length and caps analysis: bisect each value into its bucket and
+        # apply that bucket's penalty rule, if any
+        length = features.text_length
+        caps_ratio = features.caps_ratio
+        rules = (
+            self.LENGTH_PENALTIES[bisect.bisect_right(self.LENGTH_BUCKETS, length)],
+            self.CAPS_PENALTIES[bisect.bisect_left(self.CAPS_BUCKETS, caps_ratio)],
+        )
+        for rule in rules:
+            if rule is None:
+                continue
+            penalty_type, severity, penalty, description, details, warning = rule
             score -= penalty
-            penalties.append({
-                'type': 'HIGH_CAPS',
-                'severity': 'MEDIUM',
-                'impact': f'-{penalty}%',
-                'description': f'High capitalization ({caps_ratio:.1%})',
-                'details': 'Reduces perceived quality'
-            })
-            warnings.append(f'⚠️  High caps ratio ({caps_ratio:.0%}) - reduce for better quality')
+            penalties.append(Penalty(
+                type=penalty_type,
+                severity=severity,
+                impact=f'-{penalty}%',
+                description=description.format(length=length, caps_ratio=caps_ratio),
+                details=details if emit_details else None
+            ))
+            if warning:
+                warnings.append(warning.format(length=length, caps_ratio=caps_ratio))
 
         # Whitespace abuse
-        if features['newline_count'] > 10:
+        if features.newline_count > 10:
             penalty = 20
             score -= penalty
-            penalties.append({
-                'type': 'EXCESSIVE_NEWLINES',
-                'severity': 'MEDIUM',
-                'impact': f'-{penalty}%',
-                'description': f'Excessive newlines ({features["newline_count"]})',
-                'details': 'May be flagged as spam'
-            })
-            warnings.append(f'⚠️  Too many newlines ({features["newline_count"]}) - may appear spammy')
+            penalties.append(Penalty(
+                type='EXCESSIVE_NEWLINES',
+                severity='MEDIUM',
+                impact=f'-{penalty}%',
+                description=f'Excessive newlines ({features.newline_count})',
+                details='May be flagged as spam' if emit_details else None
+            ))
+            warnings.append(f'⚠️  Too many newlines ({features.newline_count}) - may appear spammy')
 
         # Hashtag spam
-        if features['hashtag_count'] > 5:
+        if features.hashtag_count > 5:
             penalty = 25
             score -= penalty
-            penalties.append({
-                'type': 'HASHTAG_SPAM',
-                'severity': 'MEDIUM',
-                'impact': f'-{penalty}%',
-                'description': f'Too many hashtags ({features["hashtag_count"]})',
-                'details': 'Reduces engagement, looks spammy'
-            })
-            warnings.append(f'⚠️  Too many hashtags ({features["hashtag_count"]}) - use 1-3 max')
+            penalties.append(Penalty(
+                type='HASHTAG_SPAM',
+                severity='MEDIUM',
+                impact=f'-{penalty}%',
+                description=f'Too many hashtags ({features.hashtag_count})',
+                details='Reduces engagement, looks spammy' if emit_details else None
+            ))
+            warnings.append(f'⚠️  Too many hashtags ({features.hashtag_count}) - use 1-3 max')
 
         return max(score, 0), warnings, penalties
 
-    def _analyze_engagement_potential(self, features: Dict) -> Tuple[float, List[Dict]]:
+    def _analyze_engagement_potential(self, features: Features) -> Tuple[float, List[Boost]]:
         """
         Analyze engagement boosting features
         Returns: (score, boosts)
         """
+        # Class thresholds as locals (LOAD_FAST instead of attribute lookups)
+        sweet_min = self.SWEET_SPOT_MIN
+        sweet_max = self.SWEET_SPOT_MAX
+        recommended_caps = self.RECOMMENDED_CAPS_RATIO
+
         score = 50.0  # Baseline
         boosts = []
 
         # Question boost (confirmed engagement signal)
-        if features['has_question']:
+        if features.has_question:
             boost = 15
             score += boost
-            boosts.append({
-                'type': 'HAS_QUESTION',
-                'impact': f'+{boost}%',
-                'description': 'Question detected',
-                'details': 'Questions increase reply likelihood'
-            })
+            boosts.append(Boost(
+                type='HAS_QUESTION',
+                impact=f'+{boost}%',
+                description='Question detected',
+                details='Questions increase reply likelihood'
+            ))
 
         # Media boost (major engagement driver)
-        if features['has_media']:
-            if features['media_type'] == 'video':
+        if features.has_media:
+            if features.media_type == 'video':
                 boost = 30
                 score += boost
-                boosts.append({
-                    'type': 'VIDEO_MEDIA',
-                    'impact': f'+{boost}%',
-                    'description': 'Video content',
-                    'details': 'Video gets highest engagement'
-                })
-            elif features['media_type'] == 'gif':
+                boosts.append(Boost(
+                    type='VIDEO_MEDIA',
+                    impact=f'+{boost}%',
+                    description='Video content',
+                    details='Video gets highest engagement'
+                ))
+            elif features.media_type == 'gif':
                 boost = 20
                 score += boost
-                boosts.append({
-                    'type': 'GIF_MEDIA',
-                    'impact': f'+{boost}%',
-                    'description': 'GIF content',
-                    'details': 'GIFs boost engagement'
-                })
-            elif features['media_type'] == 'image':
+                boosts.append(Boost(
+                    type='GIF_MEDIA',
+                    impact=f'+{boost}%',
+                    description='GIF content',
+                    details='GIFs boost engagement'
+                ))
+            elif features.media_type == 'image':
                 boost = 25
                 score += boost
-                boosts.append({
-                    'type': 'IMAGE_MEDIA',
-                    'impact': f'+{boost}%',
-                    'description': 'Image content',
-                    'details': 'Images significantly boost engagement'
-                })
+                boosts.append(Boost(
+                    type='IMAGE_MEDIA',
+                    impact=f'+{boost}%',
+                    description='Image content',
+                    details='Images significantly boost engagement'
+                ))
             else:
                 boost = 20
                 score += boost
-                boosts.append({
-                    'type': 'MEDIA',
-                    'impact': f'+{boost}%',
-                    'description': 'Media present',
-                    'details': 'Media content boosts engagement'
-                })
+                boosts.append(Boost(
+                    type='MEDIA',
+                    impact=f'+{boost}%',
+                    description='Media present',
+                    details='Media content boosts engagement'
+                ))
 
         # Optimal length boost
-        length = features['text_length']
-        if self.SWEET_SPOT_MIN <= length <= self.SWEET_SPOT_MAX:
+        length = features.text_length
+        if sweet_min <= length <= sweet_max:
             boost = 10
             score += boost
-            boosts.append({
-                'type': 'OPTIMAL_LENGTH',
-                'impact': f'+{boost}%',
-                'description': f'Optimal length ({length} chars)',
-                'details': f'Sweet spot: {self.SWEET_SPOT_MIN}-{self.SWEET_SPOT_MAX} chars'
-            })
+            boosts.append(Boost(
+                type='OPTIMAL_LENGTH',
+                impact=f'+{boost}%',
+                description=f'Optimal length ({length} chars)',
+                details=f'Sweet spot: {sweet_min}-{sweet_max} chars'
+            ))
 
         # Good formatting (not too many caps)
-        if features['caps_ratio'] <= self.RECOMMENDED_CAPS_RATIO:
+        if features.caps_ratio <= recommended_caps:
             boost = 5
             score += boost
-            boosts.append({
-                'type': 'GOOD_FORMATTING',
-                'impact': f'+{boost}%',
-                'description': 'Clean formatting',
-                'details': 'Appropriate capitalization'
-            })
+            boosts.append(Boost(
+                type='GOOD_FORMATTING',
+                impact=f'+{boost}%',
+                description='Clean formatting',
+                details='Appropriate capitalization'
+            ))
 
         return min(score, 100), boosts
 
     def _calculate_overall_score(self, safety_score: float, quality_score: float,
-                                 engagement_score: float, features: Dict) -> float:
+                                 engagement_score: float, features: Features) -> float:
         """Calculate overall engagement score"""
         # Safety is most critical (can cause complete burial)
         if safety_score < 50:
@@ -459,16 +796,16 @@ class EngagementAnalyzer:
 
         # Apply Out-of-Network penalty simulation (25% reduction)
         # This is the default for tweets from people you don't follow
-        if not features.get('is_from_followed_account', False):
+        if not features.is_from_followed_account:
             overall *= 0.85  # Slight reduction to account for OON penalty
 
         return overall
 
     def _determine_risk_level(self, overall_score: float, safety_score: float,
-                              safety_penalties: List[Dict]) -> str:
+                              safety_penalties: List[Penalty]) -> str:
         """Determine risk level for the tweet"""
         # Critical safety penalties = CRITICAL risk
-        critical_penalties = [p for p in safety_penalties if p['severity'] == 'CRITICAL']
+        critical_penalties = [p for p in safety_penalties if p.severity == 'CRITICAL']
         if critical_penalties:
             return 'CRITICAL'
 
@@ -479,38 +816,44 @@ class EngagementAnalyzer:
         else:
             return 'LOW'
 
-    def _generate_recommendations(self, features: Dict, safety_score: float,
+    def _generate_recommendations(self, features: Features, safety_score: float,
                                   quality_score: float, engagement_score: float,
-                                  safety_penalties: List[Dict],
-                                  quality_penalties: List[Dict]) -> List[str]:
+                                  safety_penalties: List[Penalty],
+                                  quality_penalties: List[Penalty]) -> List[str]:
         """Generate actionable recommendations"""
+        optimal_min = self.OPTIMAL_LENGTH_MIN
+        max_caps = self.MAX_CAPS_RATIO
+        sweet_min = self.SWEET_SPOT_MIN
+        sweet_max = self.SWEET_SPOT_MAX
+        length = features.text_length
+
         recommendations = []
 
         # Safety recommendations (highest priority)
         if safety_score < 70:
             recommendations.append('🚨 CRITICAL: Remove toxic/spam/NSFW language to avoid filters')
-        if features['suspicious_urls']:
+        if features.suspicious_urls:
             recommendations.append('🔗 Replace shortened/suspicious URLs with direct links')
 
         # Quality recommendations
-        if features['text_length'] < self.OPTIMAL_LENGTH_MIN:
-            recommendations.append(f'📝 Expand your tweet to {self.OPTIMAL_LENGTH_MIN}+ characters for better engagement')
-        if features['caps_ratio'] > self.MAX_CAPS_RATIO:
+        if length < optimal_min:
+            recommendations.append(f'📝 Expand your tweet to {optimal_min}+ characters for better engagement')
+        if features.caps_ratio > max_caps:
             recommendations.append('🔤 Reduce CAPITALIZATION - use sentence case instead')
-        if features['hashtag_count'] > 3:
-            recommendations.append(f'#️⃣ Reduce hashtags to 1-3 (currently {features["hashtag_count"]})')
-        if features['newline_count'] > 5:
+        if features.hashtag_count > 3:
+            recommendations.append(f'#️⃣ Reduce hashtags to 1-3 (currently {features.hashtag_count})')
+        if features.newline_count > 5:
             recommendations.append('📄 Reduce excessive line breaks')
 
         # Engagement recommendations
-        if not features['has_question'] and features['text_length'] > 50:
+        if not features.has_question and length > 50:
             recommendations.append('❓ Consider adding a question to boost replies')
-        if not features['has_media']:
+        if not features.has_media:
             recommendations.append('📸 Add an image or video for +20-30% engagement boost')
 
         # Length optimization
-        if features['text_length'] < self.SWEET_SPOT_MIN and features['text_length'] >= self.OPTIMAL_LENGTH_MIN:
-            recommendations.append(f'💡 Sweet spot is {self.SWEET_SPOT_MIN}-{self.SWEET_SPOT_MAX} chars for maximum engagement')
+        if optimal_min <= length < sweet_min:
+            recommendations.append(f'💡 Sweet spot is {sweet_min}-{sweet_max} chars for maximum engagement')
 
         if not recommendations:
             recommendations.append('✅ Looks good! This tweet should perform well.')
@@ -518,8 +861,112 @@ class EngagementAnalyzer:
         return recommendations
 
 
-def format_analysis_report(result: AnalysisResult) -> str:
-    """Format analysis result as a readable report"""
+_DEFAULT_ANALYZER = None
+
+
+def get_analyzer() -> EngagementAnalyzer:
+    """Shared EngagementAnalyzer, created on first use so regexes compile once"""
+    global _DEFAULT_ANALYZER
+    if _DEFAULT_ANALYZER is None:
+        _DEFAULT_ANALYZER = EngagementAnalyzer()
+    return _DEFAULT_ANALYZER
+
+
+# Media types as integers for _score_kernel (0 = other/unknown media)
+_MEDIA_TYPE_CODES = {'image': 1, 'video': 2, 'gif': 3}
+
+# Thresholds as module globals so numba can freeze them into the kernel
+_SWEET_SPOT_MIN = EngagementAnalyzer.SWEET_SPOT_MIN
+_SWEET_SPOT_MAX = EngagementAnalyzer.SWEET_SPOT_MAX
+_RECOMMENDED_CAPS_RATIO = EngagementAnalyzer.RECOMMENDED_CAPS_RATIO
+
+# Quality rule tables reduced to bucket bounds and penalty points (0 where a
+# bucket has no rule), so the kernel follows any edit to the tables
+_LENGTH_BUCKETS = EngagementAnalyzer.LENGTH_BUCKETS
+_LENGTH_PENALTY_POINTS = tuple(rule[2] if rule else 0
+                               for rule in EngagementAnalyzer.LENGTH_PENALTIES)
+_CAPS_BUCKETS = EngagementAnalyzer.CAPS_BUCKETS
+_CAPS_PENALTY_POINTS = tuple(rule[2] if rule else 0
+                             for rule in EngagementAnalyzer.CAPS_PENALTIES)
+
+
+@njit(cache=True)
+def _score_kernel(toxic_count, spam_count, has_nsfw, has_suspicious_url,
+                  length, caps_ratio, newline_count, hashtag_count,
+                  has_question, has_media, media_type_code):
+    """
+    Scalar mirror of the _analyze_* scoring (test_examples.py --batch checks it)
+    Returns: (safety, quality, engagement, overall)
+    """
+    safety = 100.0
+    if toxic_count > 0:
+        safety -= min(toxic_count * 15, 60)
+    if spam_count > 0:
+        safety -= min(spam_count * 20, 70)
+    if has_nsfw:
+        safety -= 50
+    if has_suspicious_url:
+        safety -= 40
+    safety = max(safety, 0.0)
+
+    quality = 100.0
+    # Linear bisect_right / bisect_left over the (short) bucket tuples
+    bucket = 0
+    while bucket < len(_LENGTH_BUCKETS) and length >= _LENGTH_BUCKETS[bucket]:
+        bucket += 1
+    quality -= _LENGTH_PENALTY_POINTS[bucket]
+    bucket = 0
+    while bucket < len(_CAPS_BUCKETS) and caps_ratio > _CAPS_BUCKETS[bucket]:
+        bucket += 1
+    quality -= _CAPS_PENALTY_POINTS[bucket]
+    if newline_count > 10:
+        quality -= 20
+    if hashtag_count > 5:
+        quality -= 25
+    quality = max(quality, 0.0)
+
+    engagement = 50.0
+    if has_question:
+        engagement += 15
+    if has_media:
+        if media_type_code == 2:
+            engagement += 30
+        elif media_type_code == 1:
+            engagement += 25
+        else:
+            engagement += 20
+    if _SWEET_SPOT_MIN <= length <= _SWEET_SPOT_MAX:
+        engagement += 10
+    if caps_ratio <= _RECOMMENDED_CAPS_RATIO:
+        engagement += 5
+    engagement = min(engagement, 100.0)
+
+    if safety < 50:
+        overall = safety * 0.5
+    else:
+        overall = (safety * 0.4) + (quality * 0.3) + (engagement * 0.3)
+        overall *= 0.85  # Out-of-network penalty, see _calculate_overall_score
+
+    return safety, quality, engagement, overall
+
+
+@njit(cache=True)
+def _score_batch_kernel(toxic_count, spam_count, has_nsfw, has_suspicious_url,
+                        length, caps_ratio, newline_count, hashtag_count,
+                        has_question, has_media, media_type_code):
+    """Overall scores for parallel feature arrays (numba only)"""
+    out = np.empty(len(length))
+    for i in range(len(length)):
+        out[i] = _score_kernel(
+            toxic_count[i], spam_count[i], has_nsfw[i], has_suspicious_url[i],
+            length[i], caps_ratio[i], newline_count[i], hashtag_count[i],
+            has_question[i], has_media[i], media_type_code[i],
+        )[3]
+    return out
+
+
+def _report_lines(result: AnalysisResult) -> Iterator[str]:
+    """Yield the lines of the analysis report (without trailing newlines)"""
     risk_emoji = {
         'LOW': '✅',
         'MEDIUM': '⚠️ ',
@@ -527,77 +974,89 @@ def format_analysis_report(result: AnalysisResult) -> str:
         'CRITICAL': '🚨'
     }
 
-    report = []
-    report.append('=' * 70)
-    report.append('X ENGAGEMENT DASHBOARD - ANALYSIS REPORT')
-    report.append('=' * 70)
-    report.append('')
+    yield '=' * 70
+    yield 'X ENGAGEMENT DASHBOARD - ANALYSIS REPORT'
+    yield '=' * 70
+    yield ''
 
     # Overall score
-    report.append(f'{risk_emoji[result.risk_level]} OVERALL SCORE: {result.overall_score}/100')
-    report.append(f'   Risk Level: {result.risk_level}')
-    report.append('')
+    yield f'{risk_emoji[result.risk_level]} OVERALL SCORE: {result.overall_score}/100'
+    yield f'   Risk Level: {result.risk_level}'
+    yield ''
 
     # Score breakdown
-    report.append('SCORE BREAKDOWN:')
-    report.append(f'  Safety Score:      {result.safety_score}/100')
-    report.append(f'  Quality Score:     {result.quality_score}/100')
-    report.append(f'  Engagement Score:  {result.engagement_potential}/100')
-    report.append('')
+    yield 'SCORE BREAKDOWN:'
+    yield f'  Safety Score:      {result.safety_score}/100'
+    yield f'  Quality Score:     {result.quality_score}/100'
+    yield f'  Engagement Score:  {result.engagement_potential}/100'
+    yield ''
 
     # Penalties
     if result.penalties:
-        report.append('⚠️  PENALTIES DETECTED:')
+        yield '⚠️  PENALTIES DETECTED:'
         for penalty in result.penalties:
-            report.append(f'  [{penalty["severity"]}] {penalty["type"]}: {penalty["impact"]}')
-            report.append(f'    → {penalty["description"]}')
-            if 'details' in penalty:
-                report.append(f'    ℹ️  {penalty["details"]}')
-        report.append('')
+            yield f'  [{penalty.severity}] {penalty.type}: {penalty.impact}'
+            yield f'    → {penalty.description}'
+            if penalty.details:
+                yield f'    ℹ️  {penalty.details}'
+        yield ''
 
     # Boosts
     if result.boosts:
-        report.append('✨ ENGAGEMENT BOOSTS:')
+        yield '✨ ENGAGEMENT BOOSTS:'
         for boost in result.boosts:
-            report.append(f'  [+] {boost["type"]}: {boost["impact"]}')
-            report.append(f'    → {boost["description"]}')
-            if 'details' in boost:
-                report.append(f'    ℹ️  {boost["details"]}')
-        report.append('')
+            yield f'  [+] {boost.type}: {boost.impact}'
+            yield f'    → {boost.description}'
+            if boost.details:
+                yield f'    ℹ️  {boost.details}'
+        yield ''
 
     # Warnings
     if result.warnings:
-        report.append('⚠️  WARNINGS:')
+        yield '⚠️  WARNINGS:'
         for warning in result.warnings:
-            report.append(f'  • {warning}')
-        report.append('')
+            yield f'  • {warning}'
+        yield ''
 
     # Recommendations
-    report.append('💡 RECOMMENDATIONS:')
+    yield '💡 RECOMMENDATIONS:'
     for rec in result.recommendations:
-        report.append(f'  • {rec}')
-    report.append('')
+        yield f'  • {rec}'
+    yield ''
 
     # Feature details
-    report.append('📊 CONTENT ANALYSIS:')
+    yield '📊 CONTENT ANALYSIS:'
     features = result.feature_breakdown
-    report.append(f'  Length: {features["text_length"]} characters')
-    report.append(f'  Capitalization: {features["caps_ratio"]:.1%}')
-    report.append(f'  Question marks: {features["question_count"]}')
-    report.append(f'  URLs: {features["url_count"]}')
-    report.append(f'  Mentions: {features["mention_count"]}')
-    report.append(f'  Hashtags: {features["hashtag_count"]}')
-    report.append(f'  Has media: {features["has_media"]}')
-    if features['has_media']:
-        report.append(f'  Media type: {features["media_type"]}')
-    report.append('')
-
-    report.append('=' * 70)
-    report.append('Based on X\'s open-sourced algorithm')
-    report.append('https://github.com/twitter/the-algorithm')
-    report.append('=' * 70)
-
-    return '\n'.join(report)
+    yield f'  Length: {features.text_length} characters'
+    yield f'  Capitalization: {features.caps_ratio:.1%}'
+    yield f'  Question marks: {features.question_count}'
+    yield f'  URLs: {features.url_count}'
+    yield f'  Mentions: {features.mention_count}'
+    yield f'  Hashtags: {features.hashtag_count}'
+    yield f'  Has media: {features.has_media}'
+    if features.has_media:
+        yield f'  Media type: {features.media_type}'
+    yield ''
+
+    yield '=' * 70
+    yield 'Based on X\'s open-sourced algorithm'
+    yield 'https://github.com/twitter/the-algorithm'
+    yield '=' * 70
+
+
+def format_analysis_report(result: AnalysisResult, out: TextIO = None) -> Optional[str]:
+    """
+    Format analysis result as a readable report
+
+    Returns the report as a string, or, if `out` is given, writes it there
+    line by line (newline-terminated) and returns None.
+    """
+    if out is None:
+        return '\n'.join(_report_lines(result))
+    for line in _report_lines(result):
+        out.write(line)
+        out.write('\n')
+    return None
 
 
 def main():
@@ -647,15 +1106,15 @@ def main():
     print()
 
     # Analyze
-    analyzer = EngagementAnalyzer()
+    analyzer = get_analyzer()
     result = analyzer.analyze(text, has_media, media_type, is_reply)
 
     # Print report
-    print(format_analysis_report(result))
+    format_analysis_report(result, sys.stdout)
 
     # JSON output option
     if input('\nExport as JSON? (y/n): ').lower().startswith('y'):
-        json_output = json.dumps(asdict(result), indent=2)
+        json_output = json.dumps(result.to_dict(), indent=2)
         with open('engagement_analysis.json', 'w') as f:
             f.write(json_output)
         print('✅ Saved to engagement_analysis.json')
@@ -3,175 +3,309 @@
 Test Examples for X Engagement Dashboard
 
 Run this to see how different tweet types are scored.
-"""
 
-from analyzer import EngagementAnalyzer, format_analysis_report
+Pass --batch (or set BATCH=1) to skip the prompts and run every example
+back to back, e.g. for profiling:
 
+    python -m cProfile -s cumulative test_examples.py --batch
 
-def print_separator():
-    print('\n' + '=' * 80 + '\n')
+Add --jobs N to analyze the examples in N worker processes instead of
+in-process (only worth it for large case lists; the profile above then
+shows no analyzer frames).
 
+Batch runs finish by checking PINNED_SCORES, that score() agrees with
+analyze() and, with hyperscan installed, that its prefilter never rules out
+a \\s or \\d match; any failure exits non-zero.
+"""
 
-def test_tweet(description, text, has_media=False, media_type=None, is_reply=False):
-    """Test a single tweet and print results"""
-    print(f"TEST: {description}")
-    print_separator()
-    print(f"TWEET TEXT:\n{text}")
-    print_separator()
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
 
-    analyzer = EngagementAnalyzer()
-    result = analyzer.analyze(text, has_media, media_type, is_reply)
+from analyzer import AnalysisResult, format_analysis_report, get_analyzer
 
-    print(format_analysis_report(result))
-    print_separator()
-    input("Press Enter to continue to next example...")
-    print_separator()
+# Pause for Enter between examples only when a person is watching
+INTERACTIVE = (sys.stdout.isatty() and '--batch' not in sys.argv
+               and not os.environ.get('BATCH'))
 
+_BANNER = '=' * 80
+_SEP = '\n' + _BANNER + '\n'
+_SEP_LINE = _SEP + '\n'  # _SEP as print() would emit it
 
-def run_all_tests():
-    """Run all test examples"""
-    print("=" * 80)
-    print("X ENGAGEMENT DASHBOARD - TEST EXAMPLES")
-    print("=" * 80)
-    print("\nRunning various tweet examples to demonstrate the analyzer...")
-    print_separator()
 
+@dataclass(frozen=True, slots=True)
+class TweetCase:
+    """One example tweet and its posting context"""
+    description: str
+    text: str
+    has_media: bool = False
+    media_type: Optional[str] = None
+    is_reply: bool = False
+
+
+TEST_CASES = (
     # Example 1: SPAM - Should fail badly
-    test_tweet(
+    TweetCase(
         "SPAM TWEET - Should Score Poorly",
         "🚨 CLICK HERE NOW!!! 💰 MAKE $10,000 WORKING FROM HOME!!! 💰\n"
         "LIMITED TIME OFFER!!! BUY BITCOIN AND GET RICH FAST!!!\n"
         "DM FOR MORE INFO!!! Follow for follow!!! F4F L4L!!!\n"
         "bit.ly/totally-not-a-scam 🤑🤑🤑",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 2: TOXIC - Should get safety penalties
-    test_tweet(
+    TweetCase(
         "TOXIC TWEET - Should Trigger Safety Penalties",
         "This is the WORST app I've ever used. The developers are complete idiots. "
         "Such garbage. Everyone who uses this is stupid. I hate this trash.",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 3: NSFW - Should get filtered
-    test_tweet(
+    TweetCase(
         "NSFW TWEET - Should Trigger Content Filter",
         "Check out my explicit adult content! Link to porn site in bio. "
         "18+ only, very sexual content, nude photos available. XXX content here!",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 4: EXCESSIVE CAPS - Quality penalty
-    test_tweet(
+    TweetCase(
         "ALL CAPS TWEET - Should Get Quality Penalty",
         "THIS IS MY TWEET AND I'M SHOUTING BECAUSE I WANT ATTENTION!!! "
         "EVERYTHING IS IN CAPS!!! LOOK AT ME!!!",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 5: TOO MANY HASHTAGS - Engagement penalty
-    test_tweet(
+    TweetCase(
         "HASHTAG SPAM - Should Reduce Engagement",
         "Just posted a new photo! #photography #nature #beautiful #amazing #instagood "
         "#photooftheday #picoftheday #love #follow #like #instadaily #art #happy",
         has_media=True,
-        media_type="image"
-    )
+        media_type="image",
+    ),
 
     # Example 6: TOO SHORT - Low engagement
-    test_tweet(
+    TweetCase(
         "TOO SHORT - Low Engagement Expected",
         "ok",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 7: OPTIMAL TWEET - Should score well
-    test_tweet(
+    TweetCase(
         "OPTIMAL TWEET - Should Score High",
         "Just finished reading an amazing article about the future of AI and machine learning. "
         "The intersection of ethics and practical deployment is fascinating. "
         "What are your thoughts on responsible AI development? 🤔",
         has_media=True,
-        media_type="image"
-    )
+        media_type="image",
+    ),
 
     # Example 8: PERFECT WITH VIDEO - Should score highest
-    test_tweet(
+    TweetCase(
         "PERFECT TWEET WITH VIDEO - Maximum Score",
         "Behind the scenes of building our new feature! Here's a quick walkthrough of the "
         "development process and the challenges we faced. What features would you like to see next? 🚀",
         has_media=True,
-        media_type="video"
-    )
+        media_type="video",
+    ),
 
     # Example 9: GOOD QUESTION TWEET - Engagement boost
-    test_tweet(
+    TweetCase(
         "QUESTION TWEET - Should Boost Replies",
         "Quick question for developers: When writing tests, do you prefer TDD (test-driven development) "
         "or writing tests after implementation? I'm curious about different workflows! 🤔",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 10: TECHNICAL TWEET WITH IMAGE - Good balance
-    test_tweet(
+    TweetCase(
         "TECHNICAL CONTENT WITH MEDIA - Well Balanced",
         "Finally solved that tricky bug in our async processing pipeline! Turns out the race condition "
         "was caused by improper lock handling. Here's the fix 👇",
         has_media=True,
-        media_type="image"
-    )
+        media_type="image",
+    ),
 
     # Example 11: SUSPICIOUS URL - Should trigger warning
-    test_tweet(
+    TweetCase(
         "SUSPICIOUS URL - Should Trigger Warning",
         "Check out this amazing deal! Click here for more info: bit.ly/123abc "
         "Limited time only! Visit: tinyurl.com/xyz789",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 12: CLEAN ANNOUNCEMENT - Should do well
-    test_tweet(
+    TweetCase(
         "CLEAN ANNOUNCEMENT - Good Engagement Potential",
         "Excited to announce that we're launching our new product next week! "
         "It's been months of hard work and we can't wait to share it with you. "
         "Stay tuned for the big reveal! 🎉",
         has_media=True,
-        media_type="gif"
-    )
+        media_type="gif",
+    ),
 
     # Example 13: THREAD STARTER - Good for replies
-    test_tweet(
+    TweetCase(
         "THREAD STARTER - Designed for Engagement",
         "Let me share 5 productivity tips that changed how I work:\n\n"
         "1. Time blocking - dedicating specific hours to specific tasks\n"
         "2. Batch processing - handling similar tasks together\n"
         "3. The 2-minute rule - if it takes less than 2 minutes, do it now\n\n"
         "Which one do you use? 🧵",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 14: MODERATE LENGTH NO MEDIA - Baseline
-    test_tweet(
+    TweetCase(
         "MODERATE TWEET WITHOUT MEDIA - Baseline Score",
         "Working on improving our documentation today. Good docs are just as important "
         "as good code, but they're often overlooked. Taking the time to write clear, "
         "helpful documentation pays dividends in the long run.",
-        has_media=False
-    )
+        has_media=False,
+    ),
 
     # Example 15: BORDERLINE TOXIC - Edge case
-    test_tweet(
+    TweetCase(
         "BORDERLINE NEGATIVE - Edge Case Testing",
         "Really disappointed with this update. The new UI is confusing and removes features "
         "that I used daily. I understand change is necessary, but this feels like a step backwards. "
         "Hope they reconsider some of these decisions.",
-        has_media=False
-    )
+        has_media=False,
+    ),
+)
+
+# Overall scores from the original one-regex-per-pattern, IGNORECASE
+# analyzer, for overlapping spam patterns and case-folding edge cases
+PINNED_SCORES = (
+    ("Bitcoin: click here, buy now, guaranteed returns", 20.0),
+    ("dm for details click here act now $50", 20.0),
+    ("Get crypto now click here guaranteed profit", 57.4),
+    ("You are an İDİOT", 60.8),
+    ("STUPİD people", 60.8),
+    ("ſtupid", 60.8),
+)
+
+
+def test_tweet(case: TweetCase, result: AnalysisResult) -> None:
+    """Print a single example tweet and its analysis result"""
+    # One write per example instead of one per line
+    sys.stdout.write('\n'.join([
+        f"TEST: {case.description}",
+        _SEP,
+        f"TWEET TEXT:\n{case.text}",
+        _SEP,
+        format_analysis_report(result),
+        _SEP,
+    ]) + '\n')
+    if INTERACTIVE:
+        input("Press Enter to continue to next example...")
+        sys.stdout.write(_SEP_LINE)
+
+
+def _analyze_case(case: TweetCase) -> AnalysisResult:
+    """Analyze one example on this process's shared analyzer"""
+    return get_analyzer().analyze(case.text, case.has_media,
+                                  case.media_type, case.is_reply)
+
+
+def analyze_cases(cases: Sequence[TweetCase], jobs: int = 1) -> List[AnalysisResult]:
+    """Analyze examples in case order, in `jobs` worker processes if above 1"""
+    if jobs < 2 or len(cases) < 2:
+        return get_analyzer().analyze_batch(
+            [case.text for case in cases],
+            [case.has_media for case in cases],
+            [case.media_type for case in cases],
+            [case.is_reply for case in cases],
+        )
+
+    # One contiguous slice per worker keeps pickling round trips to a minimum
+    chunksize = -(-len(cases) // jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_analyze_case, cases, chunksize=chunksize))
 
-    print("\n" + "=" * 80)
+
+def check_scores() -> None:
+    """
+    Exit with an error if any pinned tweet's score has drifted, or if the
+    score() fast path disagrees with analyze() on any example or pinned tweet
+    """
+    analyzer = get_analyzer()
+    failures = []
+    for text, expected in PINNED_SCORES:
+        score = analyzer.analyze(text).overall_score
+        if score != expected:
+            failures.append(f"  {text!r}: overall score {score}, expected {expected}")
+
+    texts = [case.text for case in TEST_CASES] + [text for text, _ in PINNED_SCORES]
+    for text in texts:
+        for has_media, media_type in ((False, None), (True, 'image'),
+                                      (True, 'video'), (True, 'gif')):
+            score = analyzer.score(text, has_media, media_type)
+            expected = analyzer.analyze(text, has_media, media_type).overall_score
+            if score != expected:
+                failures.append(f"  {text[:40]!r} ({media_type}): score() {score}, "
+                                f"analyze() {expected}")
+
+    if failures:
+        sys.exit("Score check failed:\n" + "\n".join(failures))
+    print(f"Score checks passed ({len(PINNED_SCORES)} pinned tweets, "
+          f"{len(texts)} tweets through score())", file=sys.stderr)
+
+
+def check_prefilter() -> None:
+    """Exit with an error if Hyperscan rules out a match re finds via \\s or \\d"""
+    analyzer = get_analyzer()
+    if analyzer.safety_db is None:
+        return
+    space, digit = re.compile(r'\s'), re.compile(r'\d')
+    missed = []
+    for code_point in range(sys.maxunicode + 1):
+        c = chr(code_point)
+        if space.match(c) and not analyzer._safety_categories(f"kill{c}you")[0]:
+            missed.append(f"  \\s U+{code_point:04X}")
+        if digit.match(c) and not analyzer._safety_categories(f"make ${c}")[1]:
+            missed.append(f"  \\d U+{code_point:04X}")
+    if missed:
+        sys.exit("Prefilter check failed:\n" + "\n".join(missed))
+    print("Prefilter check passed (every \\s and \\d code point)", file=sys.stderr)
+
+
+def parse_jobs(argv: Sequence[str]) -> int:
+    """Worker process count from "--jobs N", or 1 (analyze in-process)"""
+    if '--jobs' not in argv:
+        return 1
+    try:
+        jobs = int(argv[argv.index('--jobs') + 1])
+    except (IndexError, ValueError):
+        jobs = 0
+    if jobs < 1:
+        sys.exit("--jobs needs a positive integer")
+    return jobs
+
+
+def run_all_tests(jobs: int = 1) -> None:
+    """Run all test examples"""
+    print(_BANNER)
+    print("X ENGAGEMENT DASHBOARD - TEST EXAMPLES")
+    print(_BANNER)
+    print("\nRunning various tweet examples to demonstrate the analyzer...")
+    sys.stdout.write(_SEP_LINE)
+
+    results = analyze_cases(TEST_CASES, jobs)
+    for case, result in zip(TEST_CASES, results):
+        test_tweet(case, result)
+
+    print("\n" + _BANNER)
     print("ALL TESTS COMPLETE!")
-    print("=" * 80)
+    print(_BANNER)
     print("\nKey Takeaways:")
     print("1. Spam and toxic content gets heavily penalized")
     print("2. Media (especially video) provides significant engagement boost")
@@ -179,17 +313,22 @@ def run_all_tests():
     print("4. Optimal length is 100-200 characters")
     print("5. Excessive caps, hashtags, and suspicious URLs hurt performance")
     print("6. Clean, well-formatted content with context performs best")
-    print("=" * 80)
+    print(_BANNER)
 
 
 if __name__ == '__main__':
-    import sys
-
+    jobs = parse_jobs(sys.argv)
     print("\nX Engagement Dashboard - Test Examples")
     print("This will run through 15 example tweets to demonstrate the analyzer.\n")
 
-    response = input("Ready to start? (y/n): ")
-    if response.lower().startswith('y'):
-        run_all_tests()
+    if not INTERACTIVE:
+        # Nobody is watching, so let output collect in the buffer
+        if isinstance(sys.stdout, io.TextIOWrapper):
+            sys.stdout.reconfigure(line_buffering=False)
+        run_all_tests(jobs)
+        check_scores()
+        check_prefilter()
+    elif input("Ready to start? (y/n): ").lower().startswith('y'):
+        run_all_tests(jobs)
     else:
         print("Cancelled.")